@@ -0,0 +1,349 @@
+# AUTO-TUNING HORS-LIGNE DES GESTES
+# Rejoue des sessions enregistrées (calibration.py, touche 'r') à travers la logique
+# de gestures_core.py pour une grille ou une recherche aléatoire de paramètres,
+# puis écrit un fichier de config classé (même format que config.example.py).
+#
+#   python autotune.py session_*.npz --random 5000 --workers 8 -o config.tuned.py
+#   python autotune.py session_*.npz --grid --rot-per-travel 3.0
+#
+# La rotation et le zoom sont évalués vectorisés sur un lot de paramètres (une
+# boucle sur les frames, numpy sur les candidats) ; les lots tournent en parallèle
+# dans un pool de processus.
+#
+# Les gains ne sont pas recherchés : jitter, réponse et faux déclenchements sont
+# notés sur la sortie à gain unitaire. ROT_GAIN / ZOOM_GAIN sont ensuite calculés
+# pour chaque candidat afin que la sortie totale atteigne la cible choisie par
+# l'utilisateur (--rot-per-travel / --zoom-per-travel, ou gains de la config),
+# en compensant ce que le lissage et les deadzones absorbent.
+import argparse
+import glob
+import itertools
+import os
+import runpy
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import numpy as np
+
+from gestures_core import (
+    GestureParams, FREEZE_DURATION, THUMB_TIP, WRIST,
+    fist_closed, is_pinching, load_session,
+)
+
+# Paramètres recherchés : (nom config, champ GestureParams, min, max, échelle log)
+PARAMS = [
+    ("SMOOTH",        "smooth",        0.0,    0.95,  False),
+    ("ROT_DEADZONE",  "rot_deadzone",  1e-5,   0.01,  True),
+    ("ZOOM_DEADZONE", "zoom_deadzone", 1e-4,   0.03,  True),
+]
+# Gains calculés par candidat (voir evaluate)
+GAINS = ["ROT_GAIN", "ZOOM_GAIN"]
+
+# Grille par défaut (--grid) : 12 x 12 x 10 = 1440 candidats
+GRID = {
+    "SMOOTH":        [0.0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.75, 0.8, 0.85, 0.9],
+    "ROT_DEADZONE":  [1e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 1.5e-3, 2e-3, 3e-3, 4e-3, 6e-3, 8e-3],
+    "ZOOM_DEADZONE": [5e-4, 1e-3, 2e-3, 3e-3, 5e-3, 7.5e-3, 0.01, 0.015, 0.02, 0.03],
+}
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "config.py")
+
+CLEAN_WINDOW = 5     # fenêtre (frames) du signal "intention" débruité
+STILL_EPS = 0.002    # mouvement/frame sous lequel la main est considérée immobile
+TRIGGER_EPS = 0.002  # sortie à gain unitaire comptée comme déclenchement
+
+# ============================================
+# 🎬 PRÉPARATION DES SESSIONS
+# ============================================
+
+def _smooth_segments(x, mask, w):
+    """Moyenne mobile centrée de x (T, ...) limitée aux segments contigus où mask est vrai"""
+    out = np.zeros_like(x, dtype=np.float64)
+    half = w // 2
+    idx = np.flatnonzero(mask)
+    if idx.size == 0:
+        return out
+    breaks = np.flatnonzero(np.diff(idx) > 1) + 1
+    for seg in np.split(idx, breaks):
+        a, b = seg[0], seg[-1] + 1
+        csum = np.concatenate([np.zeros((1,) + x.shape[1:]), np.cumsum(x[a:b], axis=0)])
+        pos = np.arange(b - a)
+        lo = np.maximum(pos - half, 0)
+        hi = np.minimum(pos + half + 1, b - a)
+        cnt = (hi - lo).reshape((-1,) + (1,) * (x.ndim - 1))
+        out[a:b] = (csum[hi] - csum[lo]) / cnt
+    return out
+
+def session_features(t, n_hands, landmarks):
+    """Extrait les signaux indépendants des paramètres réglés (masques, poignet, distance de pincement)"""
+    n = len(t)
+    frozen = np.zeros(n, dtype=bool)
+    both_pinch = np.zeros(n, dtype=bool)
+    dist = np.zeros(n, dtype=np.float64)
+    freeze_until = 0.0
+    for i in range(n):
+        frozen[i] = t[i] < freeze_until
+        if n_hands[i] >= 2:
+            h0, h1 = landmarks[i, 0], landmarks[i, 1]
+            both_pinch[i] = is_pinching(h0) and is_pinching(h1)
+            dist[i] = np.linalg.norm(h1[THUMB_TIP, :2] - h0[THUMB_TIP, :2])
+        if n_hands[i] > 0 and fist_closed(landmarks[i, 0]):
+            freeze_until = t[i] + FREEZE_DURATION
+
+    rot_active = (n_hands == 1) & ~frozen
+    zoom_active = (n_hands >= 2) & ~frozen & both_pinch
+    wrist = np.nan_to_num(landmarks[:, 0, WRIST, :2].astype(np.float64))
+
+    # Deltas du poignet : n'existent que si la frame précédente était aussi en rotation
+    has_delta = rot_active.copy()
+    has_delta[0] = False
+    has_delta[1:] &= rot_active[:-1]
+    delta = np.zeros((n, 2))
+    delta[1:] = wrist[1:] - wrist[:-1]
+    delta[~has_delta] = 0.0
+
+    # Intention "propre" : mêmes signaux débruités par une moyenne centrée
+    clean_wrist = _smooth_segments(wrist, rot_active, CLEAN_WINDOW)
+    clean_delta = np.zeros((n, 2))
+    clean_delta[1:] = clean_wrist[1:] - clean_wrist[:-1]
+    clean_delta[~has_delta] = 0.0
+    clean_dist = _smooth_segments(dist, zoom_active, CLEAN_WINDOW)
+
+    return {
+        "rot_active": rot_active, "has_delta": has_delta, "delta": delta, "clean_delta": clean_delta,
+        "zoom_active": zoom_active, "dist": dist, "clean_dist": clean_dist,
+    }
+
+# ============================================
+# ⚡ REJEU VECTORISÉ (P candidats à la fois)
+# ============================================
+
+def replay_rotation(f, rot_gain, smooth, rot_deadzone, vel_decay):
+    """Même logique que GestureState.update (rotation), sur P candidats. Retourne (T, P, 2)."""
+    n, p = len(f["delta"]), len(rot_gain)
+    out = np.zeros((n, p, 2))
+    vel = np.zeros((p, 2))
+    s = smooth[:, None]
+    dz = rot_deadzone[:, None]
+    gain = rot_gain[:, None] * np.array([-1.0, 1.0])
+    for i in range(n):
+        if f["rot_active"][i]:
+            if f["has_delta"][i]:
+                d = f["delta"][i]
+                d = np.where(np.abs(d) < dz, 0.0, d)
+                vel = s * vel + (1.0 - s) * d
+                out[i] = vel * gain
+        else:
+            vel *= vel_decay
+    return out
+
+def replay_zoom(active, dist, zoom_gain, zoom_deadzone):
+    """Même logique que GestureState.update (zoom), sur P candidats. Retourne (T, P)."""
+    n, p = len(dist), len(zoom_gain)
+    out = np.zeros((n, p))
+    avg = np.zeros(p)
+    for i in range(n):
+        if not active[i]:
+            continue
+        if i == 0 or not active[i - 1]:
+            avg[:] = dist[i]
+        diff = dist[i] - avg
+        hit = np.abs(diff) > zoom_deadzone
+        avg = np.where(hit, 0.9 * avg + 0.1 * dist[i], avg)
+        out[i] = np.where(hit, diff * zoom_gain, 0.0)
+    return out
+
+def _metrics(out, target, active, still):
+    """(jitter, erreur de réponse, taux de faux déclenchements) par candidat, sorties (T, P, ...)"""
+    out = out.reshape(out.shape[0], out.shape[1], -1)
+    target = target.reshape(target.shape[0], 1, -1)
+    moving = active & ~still
+    scale = max(np.abs(target[moving]).sum(axis=-1).mean() if moving.any() else 0.0, 1e-9)
+
+    both = active[1:] & active[:-1]
+    jitter = (np.abs(out[1:] - out[:-1]).sum(axis=-1)[both].mean(axis=0) / scale
+              if both.any() else np.zeros(out.shape[1]))
+    resp = (np.abs(out - target).sum(axis=-1)[moving].mean(axis=0) / scale
+            if moving.any() else np.zeros(out.shape[1]))
+    false = ((np.abs(out).sum(axis=-1) > TRIGGER_EPS)[active & still].mean(axis=0)
+             if (active & still).any() else np.zeros(out.shape[1]))
+    return np.stack([jitter, resp, false], axis=1), int(active.sum())
+
+def evaluate(features, cand, targets, vel_decay):
+    """Évalue une matrice de candidats (P, len(PARAMS)) sur toutes les sessions.
+
+    Retourne (métriques (P, 6), gains (P, 2)). Les métriques portent sur la sortie
+    à gain unitaire ; le gain de chaque candidat est choisi pour que la sortie
+    totale vaille targets × le trajet "propre" (rotation du modèle par unité de
+    déplacement du poignet, zoom par unité de la logique zoom sans deadzone).
+    """
+    smooth, rot_dz, zoom_dz = cand.T
+    ones = np.ones(len(cand))
+    totals = np.zeros((len(cand), 6))
+    weights = np.zeros(2)
+    travel = np.zeros((len(cand), 2))   # trajet de sortie à gain unitaire
+    target_travel = np.zeros(2)         # trajet de l'intention débruitée
+    for f in features:
+        # Rotation : cible = intention débruitée
+        rot = replay_rotation(f, ones, smooth, rot_dz, vel_decay)
+        rot_target = f["clean_delta"] * np.array([-1.0, 1.0])
+        rot_still = np.abs(f["clean_delta"]).sum(axis=1) < STILL_EPS
+        m, w = _metrics(rot, rot_target, f["has_delta"], rot_still)
+        totals[:, 0:3] += m * w
+        weights[0] += w
+        travel[:, 0] += np.abs(rot).sum(axis=(0, 2))
+        target_travel[0] += np.abs(rot_target).sum()
+
+        # Zoom : cible = logique zoom sans deadzone sur la distance débruitée
+        zoom = replay_zoom(f["zoom_active"], f["dist"], ones, zoom_dz)
+        zoom_target = replay_zoom(f["zoom_active"], f["clean_dist"], np.ones(1), np.zeros(1))[:, 0]
+        zoom_still = np.abs(zoom_target) < STILL_EPS
+        m, w = _metrics(zoom, zoom_target, f["zoom_active"], zoom_still)
+        totals[:, 3:6] += m * w
+        weights[1] += w
+        travel[:, 1] += np.abs(zoom).sum(axis=0)
+        target_travel[1] += np.abs(zoom_target).sum()
+    totals[:, 0:3] /= max(weights[0], 1)
+    totals[:, 3:6] /= max(weights[1], 1)
+
+    # Gain = cible × trajet voulu / trajet obtenu (cible telle quelle si aucune donnée)
+    ratio = np.where(travel > 0, target_travel / np.maximum(travel, 1e-12), 1.0)
+    ratio[:, target_travel == 0] = 1.0
+    return totals, ratio * np.asarray(targets)
+
+# ============================================
+# 🧮 POOL DE PROCESSUS
+# ============================================
+_worker_state = {}
+
+def _init_worker(features, targets, vel_decay):
+    _worker_state.update(features=features, targets=targets, vel_decay=vel_decay)
+
+def _evaluate_chunk(cand):
+    s = _worker_state
+    return evaluate(s["features"], cand, s["targets"], s["vel_decay"])
+
+def make_candidates(args, rng):
+    if args.grid:
+        return np.array(list(itertools.product(*(GRID[name] for name, *_ in PARAMS))), dtype=np.float64)
+    cols = []
+    for name, _, lo, hi, log in PARAMS:
+        if log:
+            cols.append(np.exp(rng.uniform(np.log(lo), np.log(hi), args.random)))
+        else:
+            cols.append(rng.uniform(lo, hi, args.random))
+    return np.stack(cols, axis=1)
+
+def score(metrics, weights):
+    """Score global (plus bas = meilleur) : somme pondérée rotation + zoom"""
+    w = np.array(weights * 2)
+    return metrics @ w
+
+def _values(cand, gains, i):
+    return [(name, gains[i, j]) for j, name in enumerate(GAINS)] + \
+           [(name, cand[i, j]) for j, (name, *_) in enumerate(PARAMS)]
+
+def load_targets(path):
+    """Gains et VEL_DECAY de la config (cf. gestures_server.load_config), sinon défauts du serveur"""
+    ref = GestureParams()
+    values = runpy.run_path(path) if os.path.exists(path) else {}
+    return (values.get("ROT_GAIN", ref.rot_gain), values.get("ZOOM_GAIN", ref.zoom_gain),
+            values.get("VEL_DECAY", ref.vel_decay))
+
+def write_config(path, cand, gains, metrics, scores, order, top, header):
+    lines = [
+        "# Configuration générée par autotune.py",
+        f"# {header}",
+        "# Score = jitter + erreur de réponse + faux déclenchements (rotation + zoom), plus bas = meilleur",
+        "",
+        "# ============================================",
+        "# 🏆 MEILLEUR CANDIDAT",
+        "# ============================================",
+    ]
+    best = order[0]
+    for name, value in _values(cand, gains, best):
+        lines.append(f"{name} = {value:.6g}")
+    lines += [
+        "",
+        "# ============================================",
+        "# 📝 CLASSEMENT",
+        "# ============================================",
+    ]
+    for rank, i in enumerate(order[:top], start=1):
+        rj, rr, rf, zj, zr, zf = metrics[i]
+        lines.append(f"# #{rank} score={scores[i]:.4f} | rot: jitter={rj:.3f} réponse={rr:.3f} faux={rf:.3f}"
+                     f" | zoom: jitter={zj:.3f} réponse={zr:.3f} faux={zf:.3f}")
+        lines.append('"""')
+        for name, value in _values(cand, gains, i):
+            lines.append(f"{name} = {value:.6g}")
+        lines.append('"""')
+        lines.append("")
+    with open(path, "w", encoding="utf-8") as fh:
+        fh.write("\n".join(lines))
+
+def main():
+    ap = argparse.ArgumentParser(description="Auto-tuning hors-ligne du lissage, des deadzones et des gains")
+    ap.add_argument("sessions", nargs="+", help="Fichiers session_*.npz (calibration.py, touche 'r')")
+    mode = ap.add_mutually_exclusive_group()
+    mode.add_argument("--grid", action="store_true", help="Grille fixe (GRID)")
+    mode.add_argument("--random", type=int, default=2000, help="Nombre de candidats aléatoires (défaut: 2000)")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--workers", type=int, default=None, help="Processus (défaut: nb de CPU)")
+    ap.add_argument("--chunk", type=int, default=256, help="Candidats évalués ensemble par un processus")
+    ap.add_argument("--weights", type=float, nargs=3, default=[1.0, 1.0, 1.0],
+                    metavar=("JITTER", "REPONSE", "FAUX"), help="Pondération du score")
+    ap.add_argument("--top", type=int, default=10, help="Nombre de candidats dans le classement")
+    ap.add_argument("--config", default=CONFIG_PATH,
+                    help="Config dont ROT_GAIN / ZOOM_GAIN / VEL_DECAY servent de cibles (défaut: config.py)")
+    ap.add_argument("--rot-per-travel", type=float,
+                    help="Rotation du modèle (rad) par unité de déplacement du poignet (défaut: ROT_GAIN de la config)")
+    ap.add_argument("--zoom-per-travel", type=float,
+                    help="Zoom voulu, en équivalent ZOOM_GAIN sur un signal propre (défaut: ZOOM_GAIN de la config)")
+    ap.add_argument("-o", "--output", default="config.tuned.py")
+    args = ap.parse_args()
+
+    paths = sorted({p for pattern in args.sessions for p in glob.glob(pattern)})
+    if not paths:
+        ap.error("aucune session trouvée")
+
+    # Cibles de gain : choix explicite de l'utilisateur, sinon gains de la config
+    rot_target, zoom_target, vel_decay = load_targets(args.config)
+    targets = (args.rot_per_travel or rot_target, args.zoom_per_travel or zoom_target)
+    features = [session_features(*load_session(p)) for p in paths]
+    n_frames = sum(len(f["delta"]) for f in features)
+
+    rng = np.random.default_rng(args.seed)
+    cand = make_candidates(args, rng)
+    chunks = [cand[i:i + args.chunk] for i in range(0, len(cand), args.chunk)]
+
+    print("=" * 60)
+    print("🎯 AUTO-TUNING DES GESTES")
+    print("=" * 60)
+    print(f"  Sessions   : {len(paths)} ({n_frames} frames)")
+    print(f"  Candidats  : {len(cand)} ({'grille' if args.grid else 'aléatoire'}, {len(chunks)} lots)")
+    print(f"  Cibles     : rotation {targets[0]:.4g} / unité de trajet, zoom {targets[1]:.4g}")
+
+    t0 = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker,
+                             initargs=(features, targets, vel_decay)) as pool:
+        results = list(pool.map(_evaluate_chunk, chunks))
+    metrics = np.concatenate([m for m, _ in results])
+    gains = np.concatenate([g for _, g in results])
+    elapsed = time.perf_counter() - t0
+
+    scores = score(metrics, args.weights)
+    order = np.argsort(scores)
+    print(f"  Durée      : {elapsed:.1f}s ({len(cand) / elapsed:.0f} candidats/s)")
+    print("\n🏆 Meilleurs candidats:")
+    for rank, i in enumerate(order[:min(args.top, 5)], start=1):
+        values = ", ".join(f"{name}={value:.4g}" for name, value in _values(cand, gains, i))
+        print(f"  #{rank} score={scores[i]:.4f}  {values}")
+
+    header = (f"{datetime.now().isoformat(timespec='seconds')} — {len(paths)} session(s), "
+              f"{n_frames} frames, {len(cand)} candidats")
+    write_config(args.output, cand, gains, metrics, scores, order, args.top, header)
+    print(f"\n✅ Config classée écrite: {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,294 @@
+# BENCHMARK HEADLESS DU PIPELINE DE GESTES
+# Sans caméra, écran ni réseau externe : landmarks synthétiques, frames aléatoires,
+# WebSocket en boucle locale.
+#
+#   python bench_gestures.py --save bench_baseline.json        # enregistre une baseline
+#   python bench_gestures.py --compare bench_baseline.json     # échoue si régression (cf. compare())
+#   python bench_gestures.py --only preview --threshold 0.3
+#
+# Étapes mesurées : extraction des features landmarks, mise à jour de l'état des
+# gestes, sérialisation du payload (JSON), resize+JPEG de la preview à plusieurs
+# tailles, diffusion WebSocket à N clients locaux, écriture du flight recorder.
+#
+# Le débit du CPU varie d'un run à l'autre et même en cours de run (turbo, cœur attribué,
+# voisins sur une VM) : chaque échantillon est suivi d'une petite charge de référence fixe,
+# et la comparaison porte sur le rapport étape / référence, médian sur --runs passes.
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime
+from types import SimpleNamespace
+
+import numpy as np
+import websockets
+
+import gestures_server as server
+from flight_recorder import FlightRecorder
+from gestures_core import (
+    GestureState, landmarks_to_array, finger_extended, fist_closed, is_pinching,
+)
+
+PREVIEW_SIZES = [(240, 135), (320, 180), (480, 270), (640, 360)]
+FANOUT_CLIENTS = [1, 4, 16]
+DEFAULT_THRESHOLD = 0.25  # +25% sur la statistique comparée = régression
+COMPARE_STAT = "min_us"   # le minimum est le plus stable d'une passe à l'autre (bruit d'ordonnancement)
+DEFAULT_RUNS = 3          # passes complètes, médiane par étape
+MAX_BUDGET_PCT = 1.0      # étapes avec budget_pct (recorder) : jugées sur ce plafond, pas sur la baseline
+
+# Plancher de bruit (µs) par préfixe d'étape (premier préfixe correspondant) : un écart
+# absolu plus petit que le plancher n'est jamais une régression
+NOISE_FLOOR_US = {
+    "features": 4.0, "gesture_update": 1.5, "json_preview": 15.0, "json": 1.5,
+    "preview_": 800.0, "fanout_": 500.0,
+}
+
+# ============================================
+# 🧪 DONNÉES SYNTHÉTIQUES
+# ============================================
+rng = np.random.default_rng(42)
+
+def synthetic_hand(cx=0.5, cy=0.5):
+    """Main synthétique (21, 3) autour de (cx, cy)"""
+    lm = rng.normal(0.0, 0.05, (21, 3)).astype(np.float32)
+    lm[:, 0] += cx
+    lm[:, 1] += cy
+    return lm
+
+def as_mediapipe(lm):
+    """Landmarks au format MediaPipe (objets .x/.y/.z)"""
+    return [SimpleNamespace(x=float(x), y=float(y), z=float(z)) for x, y, z in lm]
+
+def synthetic_frames(n=300):
+    """Alterne rotation (1 main), zoom (2 mains) et absence de main"""
+    frames = []
+    for i in range(n):
+        phase = (i // 50) % 3
+        if phase == 0:
+            frames.append([synthetic_hand(0.5 + 0.1 * np.sin(i / 10), 0.5)])
+        elif phase == 1:
+            frames.append([synthetic_hand(0.3, 0.5), synthetic_hand(0.7, 0.5)])
+        else:
+            frames.append([])
+    return frames
+
+# ============================================
+# ⏱️ MESURE
+# ============================================
+
+_REF_ARRAY = np.arange(64, dtype=np.float32)
+
+def reference_us():
+    """Charge de référence fixe (boucle Python, petites opérations numpy, JSON), proche des
+    étapes mesurées : étalon de vitesse du CPU, chronométré juste après chaque échantillon"""
+    t0 = time.perf_counter()
+    s = 0.0
+    for i in range(50):
+        s += float(np.linalg.norm(_REF_ARRAY[:2] - _REF_ARRAY[2:4])) + i
+    json.dumps({"s": s})
+    return (time.perf_counter() - t0) * 1e6
+
+def summarize(samples, refs):
+    samples = np.array(samples)
+    return {
+        "median_us": float(np.median(samples)),
+        "p95_us": float(np.percentile(samples, 95)),
+        "min_us": float(samples.min()),
+        "ref_us": float(min(refs)),
+    }
+
+def measure(fn, ops=1, repeat=30, warmup=3):
+    """Temps par opération (µs) : médiane, p95, min sur `repeat` échantillons, + référence"""
+    for _ in range(warmup):
+        fn()
+        reference_us()
+    samples, refs = [], []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1e6 / ops)
+        refs.append(reference_us())
+    return summarize(samples, refs)
+
+# ============================================
+# 🧩 ÉTAPES
+# ============================================
+
+def bench_features():
+    hands = [as_mediapipe(synthetic_hand()) for _ in range(100)]
+    def run():
+        for h in hands:
+            lm = landmarks_to_array(h)
+            is_pinching(lm)
+            fist_closed(lm)
+            finger_extended(lm, 8, 6)
+    return {"features": measure(run, ops=len(hands))}
+
+def bench_gesture_update():
+    frames = synthetic_frames()
+    def run():
+        state = GestureState()
+        for i, hands_lm in enumerate(frames):
+            state.update(hands_lm, i / 30.0)
+    return {"gesture_update": measure(run, ops=len(frames))}
+
+def bench_serialization():
+    payload = {"rot_dx": 0.0123, "rot_dy": -0.0045, "zoom_delta": 0.0007, "explode": 0.42, "freeze": False}
+    frame = rng.integers(0, 255, (720, 1280, 3), dtype=np.uint8)
+    with_preview = dict(payload, preview=server.encode_preview(frame))
+    return {
+        "json": measure(lambda: [json.dumps(payload) for _ in range(1000)], ops=1000),
+        "json_preview": measure(lambda: [json.dumps(with_preview) for _ in range(100)], ops=100),
+    }
+
+def bench_preview():
+    frame = rng.integers(0, 255, (720, 1280, 3), dtype=np.uint8)
+    results = {}
+    for w, h in PREVIEW_SIZES:
+        results[f"preview_{w}x{h}"] = measure(
+            lambda: [server.encode_preview(frame, (w, h), server.PREVIEW_JPEG_QUALITY) for _ in range(5)],
+            ops=5, repeat=60, warmup=5)
+    return results
+
+async def _fanout(n_clients, msg, rounds=150):
+    """Temps pour qu'un message atteigne les N clients (envoi + réception)"""
+    server.clients.clear()
+    async with websockets.serve(server.ws_handler, "127.0.0.1", 0) as ws_server:
+        port = ws_server.sockets[0].getsockname()[1]
+        conns = [await websockets.connect(f"ws://127.0.0.1:{port}") for _ in range(n_clients)]
+        await asyncio.gather(*(c.recv() for c in conns))  # message d'état envoyé à la connexion
+        while len(server.clients) < n_clients:
+            await asyncio.sleep(0.001)
+        samples, refs = [], []
+        for i in range(rounds + 10):
+            t0 = time.perf_counter()
+            await server.broadcast(msg)
+            await asyncio.gather(*(c.recv() for c in conns))
+            elapsed = (time.perf_counter() - t0) * 1e6
+            ref = reference_us()
+            if i >= 10:  # warmup
+                samples.append(elapsed)
+                refs.append(ref)
+        for c in conns:
+            await c.close()
+    return summarize(samples, refs)
+
+def bench_fanout():
+    frame = rng.integers(0, 255, (720, 1280, 3), dtype=np.uint8)
+    msg = json.dumps({"rot_dx": 0.0, "rot_dy": 0.0, "zoom_delta": 0.0, "explode": 0.0, "freeze": False,
+                      "preview": server.encode_preview(frame)})
+    return {f"fanout_{n}": asyncio.run(_fanout(n, msg)) for n in FANOUT_CLIENTS}
+
+def bench_recorder():
+    values = (time.time(), 1234, 30.1, 18.2, 0.05, 1.4, 0.8, 50.6, 0.01, -0.02, 0.003, 0.5, 1, 0, 1, 0, 3)
+    with tempfile.TemporaryDirectory() as tmp:
+        recorder = FlightRecorder(os.path.join(tmp, "flight_recorder.bin"), 10000)
+        def run():
+            for _ in range(1000):
+                recorder.record(*values)
+        result = measure(run, ops=1000)
+        recorder.close()
+        del recorder  # libère le mapping avant la suppression du dossier (Windows)
+    budget_us = 1e6 / server.FPS_LIMIT
+    result["budget_pct"] = 100.0 * result["median_us"] / budget_us
+    return {"recorder": result}
+
+STAGES = {
+    "features": bench_features,
+    "gesture": bench_gesture_update,
+    "serialization": bench_serialization,
+    "preview": bench_preview,
+    "fanout": bench_fanout,
+    "recorder": bench_recorder,
+}
+
+# ============================================
+# 📊 BASELINE / COMPARAISON
+# ============================================
+
+def run_stages(stages, runs):
+    """Médiane de chaque métrique sur `runs` passes"""
+    passes = []
+    for _ in range(runs):
+        results = {}
+        for stage in stages:
+            results.update(STAGES[stage]())
+        passes.append(results)
+    return {name: {k: float(np.median([p[name][k] for p in passes])) for k in r}
+            for name, r in passes[0].items()}
+
+def noise_floor(name):
+    return next((floor for prefix, floor in NOISE_FLOOR_US.items() if name.startswith(prefix)), 0.0)
+
+def compare(results, baseline, threshold, stat=COMPARE_STAT):
+    """Étapes en régression. La baseline est d'abord ramenée à la vitesse CPU du run courant
+    (rapport des charges de référence) ; régression = stat > attendu × (1 + threshold)
+    ET écart > plancher de bruit de l'étape. Étapes avec budget_pct : budget_pct > MAX_BUDGET_PCT"""
+    regressions = []
+    print(f"\n{'Étape':<22}{'Attendu':>12}{'Actuel':>12}{'Écart':>10}   ({stat}, baseline × vitesse CPU)")
+    for name, cur in results.items():
+        ref = baseline.get(name)
+        if "budget_pct" in cur:
+            # Quelques µs : le bruit relatif est énorme, seul compte le surcoût par frame
+            regressed = cur["budget_pct"] > MAX_BUDGET_PCT
+            print(f"{name:<22}{f'≤{MAX_BUDGET_PCT:.0f}%':>12}{cur['budget_pct']:>11.3f}%{'budget':>10} "
+                  f"{'❌' if regressed else '✅'}")
+        elif ref is None:
+            print(f"{name:<22}{'-':>12}{cur[stat]:>10.1f}µs{'nouveau':>10}")
+            continue
+        else:
+            expected = ref[stat] * (cur["ref_us"] / ref["ref_us"] if "ref_us" in ref else 1.0)
+            ratio = cur[stat] / expected - 1.0
+            regressed = ratio > threshold and cur[stat] - expected > noise_floor(name)
+            print(f"{name:<22}{expected:>10.1f}µs{cur[stat]:>10.1f}µs{ratio:>+9.0%} {'❌' if regressed else '✅'}")
+        if regressed:
+            regressions.append(name)
+    return regressions
+
+def main():
+    ap = argparse.ArgumentParser(description="Benchmark headless du pipeline de gestes")
+    ap.add_argument("--only", nargs="+", choices=list(STAGES), help="Étapes à mesurer (défaut: toutes)")
+    ap.add_argument("--save", metavar="FICHIER", help="Enregistre les résultats comme baseline JSON")
+    ap.add_argument("--compare", metavar="FICHIER", help="Compare à une baseline, code retour 1 si régression")
+    ap.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                    help="Régression tolérée, ex. 0.25 = +25%% (défaut: %(default)s)")
+    ap.add_argument("--stat", choices=["min_us", "median_us"], default=COMPARE_STAT,
+                    help="Statistique comparée (défaut: %(default)s)")
+    ap.add_argument("--runs", type=int, default=DEFAULT_RUNS,
+                    help="Passes complètes, médiane par étape (défaut: %(default)s)")
+    args = ap.parse_args()
+
+    print("=" * 60)
+    print("⏱️  BENCHMARK PIPELINE DE GESTES")
+    print("=" * 60)
+    results = run_stages(args.only or list(STAGES), args.runs)
+    for name, r in results.items():
+        extra = f"  ({r['budget_pct']:.3f}% du budget de frame)" if "budget_pct" in r else ""
+        print(f"  {name:<20} min={r['min_us']:>9.1f}µs  médiane={r['median_us']:>9.1f}µs"
+              f"  p95={r['p95_us']:>9.1f}µs  réf={r['ref_us']:>7.1f}µs{extra}")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as fh:
+            json.dump({
+                "date": datetime.now().isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "results": results,
+            }, fh, indent=2)
+        print(f"\n💾 Baseline sauvegardée: {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fh:
+            baseline = json.load(fh)["results"]
+        regressions = compare(results, baseline, args.threshold, args.stat)
+        if regressions:
+            print(f"\n❌ Régression (> {args.threshold:.0%}): {', '.join(regressions)}")
+            sys.exit(1)
+        print("\n✅ Aucune régression")
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,10 @@ import cv2
 import mediapipe as mp
 import numpy as np
 import json
+import os
+import time
 from datetime import datetime
+from gestures_core import landmarks_to_array, save_session
 
 mp_hands = mp.solutions.hands
 mp_drawing = mp.solutions.drawing_utils
@@ -31,6 +34,8 @@ print("  - 1 MAIN = Test rotation")
 print("  - 2 MAINS = Test zoom (pincez pouce+index)")
 print("  - Appuyez sur 'q' pour quitter")
 print("  - Appuyez sur 's' pour sauvegarder un snapshot")
+print("  - Appuyez sur 'r' pour démarrer/arrêter l'enregistrement d'une session (autotune.py)")
+print("  - Appuyez sur 'p' (main visible) pour enregistrer la frame de sonde du profil auto (probe_hand.jpg)")
 print("\n" + "=" * 60 + "\n")
 
 cap = cv2.VideoCapture(0, cv2.CAP_DSHOW)
@@ -43,6 +48,22 @@ moving_avg_dist = None
 frame_count = 0
 log_data = []
 
+# Frame de sonde du profil auto : à côté des scripts, là où gestures_server.py la lit
+PROBE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "probe_hand.jpg")
+
+# Enregistrement de session (landmarks bruts pour autotune.py)
+recording = False
+rec_times, rec_frames = [], []
+
+def flush_recording():
+    if not rec_frames:
+        return
+    filename = f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}.npz"
+    save_session(filename, rec_times, rec_frames)
+    print(f"🎬 Session sauvegardée: {filename} ({len(rec_frames)} frames)")
+    rec_times.clear()
+    rec_frames.clear()
+
 def is_pinching(landmarks, threshold=0.08):
     thumb = np.array([landmarks[4].x, landmarks[4].y])
     index = np.array([landmarks[8].x, landmarks[8].y])
@@ -61,6 +82,7 @@ with mp_hands.Hands(
         if not ok:
             print("❌ Erreur: Impossible de lire la webcam")
             break
+        raw = frame  # frame caméra brute, sans annotations (sonde du profil auto)
             
         frame = cv2.flip(frame, 1)
         h, w = frame.shape[:2]
@@ -83,6 +105,11 @@ with mp_hands.Hands(
                     mp_drawing.DrawingSpec(color=(255, 0, 0), thickness=2))
                 hands_lm.append(hlm.landmark)
         
+        if recording:
+            rec_times.append(time.time())
+            rec_frames.append([landmarks_to_array(lm) for lm in hands_lm])
+            cv2.circle(frame, (w - 30, 30), 10, (0, 0, 255), -1)
+        
         y_pos = 30
         line_height = 30
         
@@ -271,6 +298,21 @@ with mp_hands.Hands(
             filename = f"snapshot_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jpg"
             cv2.imwrite(filename, frame)
             print(f"📸 Snapshot sauvegardé: {filename}")
+        elif key == ord('p'):
+            if hands_lm:
+                cv2.imwrite(PROBE_PATH, raw)
+                print(f"🔧 Frame de sonde sauvegardée: {PROBE_PATH}")
+            else:
+                print("⚠️  Aucune main détectée, frame de sonde non sauvegardée")
+        elif key == ord('r'):
+            recording = not recording
+            if recording:
+                print("🔴 Enregistrement de session démarré")
+            else:
+                flush_recording()
+
+if recording:
+    flush_recording()
 
 cap.release()
 cv2.destroyAllWindows()
@@ -1,5 +1,6 @@
 # Configuration exemple pour Holo-Control v2
-# Copiez ce fichier et ajustez selon vos préférences
+# Copiez ce fichier en config.py (lu au démarrage par gestures_server.py) et ajustez selon vos préférences
+# Autre fichier : python gestures_server.py --config config.tuned.py
 
 # ============================================
 # 🌐 SERVEUR WEBSOCKET
@@ -12,31 +13,25 @@ FPS_LIMIT = 30  # Frames par seconde (15-60 recommandé)
 # 🎮 SENSIBILITÉ DES GESTES
 # ============================================
 # Rotation : Contrôle de la rotation du modèle
-ROT_GAIN = 0.006  # Défaut: 0.006 | Plus bas = plus précis | Plus haut = plus réactif
+ROT_GAIN = 2.0  # Défaut: 2.0 | Plus bas = plus précis | Plus haut = plus réactif
 
 # Zoom : Contrôle du zoom (distance mains)
-ZOOM_GAIN = 0.002  # Défaut: 0.002 | Plus bas = zoom lent | Plus haut = zoom rapide
+ZOOM_GAIN = 0.5  # Défaut: 0.5 | Plus bas = zoom lent | Plus haut = zoom rapide
 
 # Explosion : Vitesse d'explosion/implosion
 EXP_GAIN = 0.02  # Défaut: 0.02 | Plus bas = transition lente | Plus haut = transition rapide
 
 # Lissage : Fluidité des mouvements
-SMOOTH = 0.7  # Défaut: 0.7 (0-0.95) | Plus haut = plus lisse mais latence accrue
+SMOOTH = 0.3  # Défaut: 0.3 (0-0.95) | Plus haut = plus lisse mais latence accrue
 
 # ============================================
-# 🎚️ STABILISATION (Deadzones & Seuils)
+# 🎚️ STABILISATION (Deadzones)
 # ============================================
 # Deadzone Rotation : Ignore les micro-mouvements
-ROT_DEADZONE = 0.004  # Défaut: 0.004 | Augmenter si tremblements
-
-# Seuil Rotation : Mouvement minimum pour activer
-ROT_THRESHOLD = 0.008  # Défaut: 0.008 | Augmenter pour éliminer jitter
+ROT_DEADZONE = 0.00005  # Défaut: 0.00005 | Augmenter si tremblements (ex. 0.002)
 
 # Deadzone Zoom : Ignore petites variations distance
-ZOOM_DEADZONE = 0.015  # Défaut: 0.015 | Augmenter si zoom instable
-
-# Seuil Zoom : Changement minimum pour activer
-ZOOM_THRESHOLD = 0.02  # Défaut: 0.02 | Augmenter pour zoom plus stable
+ZOOM_DEADZONE = 0.002  # Défaut: 0.002 | Augmenter si zoom instable (ex. 0.01)
 
 # Décroissance Vélocité : Arrêt progressif
 VEL_DECAY = 0.85  # Défaut: 0.85 (0.5-0.95) | Plus bas = arrêt plus rapide
@@ -80,44 +75,65 @@ CAMERA_INDEX = 0
 CAMERA_WIDTH = 1280
 CAMERA_HEIGHT = 720
 
+# ============================================
+# 🛫 FLIGHT RECORDER (télémétrie par frame)
+# ============================================
+# Fichier circulaire de taille fixe : timings par étape, mains, gestes, clients, envois
+# Un fichier existant d'un autre format ou d'une autre capacité est renommé en .bak avant recréation
+# Lecture : python flight_recorder.py flight_recorder.bin stats|stalls|dump
+FLIGHT_RECORDER = True
+FLIGHT_RECORDER_PATH = "flight_recorder.bin"  # Relatif = à côté de gestures_server.py (comme config.py)
+FLIGHT_RECORDER_FRAMES = 30 * 60 * 60 * 24  # Défaut: 24 h à 30 FPS (~150 Mo) | 58 octets par frame
+
 # ============================================
 # 📝 PROFILS PRÉDÉFINIS
 # ============================================
 
 # PROFIL: Ultra Précis (contrôle fin, mouvements lents)
 """
-ROT_GAIN = 0.003
-ZOOM_GAIN = 0.001
-ROT_DEADZONE = 0.006
-ZOOM_DEADZONE = 0.02
-SMOOTH = 0.8
-"""
-
-# PROFIL: Réactif (réponse rapide, gestes larges)
-"""
-ROT_GAIN = 0.01
-ZOOM_GAIN = 0.004
-ROT_DEADZONE = 0.002
+ROT_GAIN = 1.0
+ZOOM_GAIN = 0.25
+ROT_DEADZONE = 0.001
 ZOOM_DEADZONE = 0.01
-SMOOTH = 0.5
+SMOOTH = 0.6
 """
 
-# PROFIL: Performance (faible latence, PC lent)
+# PROFIL: Réactif (réponse rapide, gestes larges)
 """
-FPS_LIMIT = 20
-PREVIEW_EVERY = 6
-PREVIEW_W, PREVIEW_H = 240, 135
-PREVIEW_JPEG_QUALITY = 50
-MODEL_COMPLEXITY = 0
+ROT_GAIN = 3.0
+ZOOM_GAIN = 0.8
+ROT_DEADZONE = 0.00002
+ZOOM_DEADZONE = 0.001
+SMOOTH = 0.2
 """
 
-# PROFIL: Qualité (haute précision, PC puissant)
-"""
-FPS_LIMIT = 60
-PREVIEW_EVERY = 2
-PREVIEW_W, PREVIEW_H = 480, 270
-PREVIEW_JPEG_QUALITY = 80
-MODEL_COMPLEXITY = 1
-DETECTION_CONFIDENCE = 0.7
-TRACKING_CONFIDENCE = 0.7
-"""
+# ============================================
+# ⚡ PROFILS DE PERFORMANCE (utilisés par le serveur)
+# ============================================
+# None = valeurs ci-dessus | "qualite" / "standard" / "performance" | "auto"
+# "auto" : micro-benchmark inférence + encodage au démarrage, choix du profil le plus
+# qualitatif qui tient son FPS_LIMIT avec AUTO_HEADROOM de marge, puis descente
+# automatique si le temps de frame dépasse le budget pendant DRIFT_SECONDS
+PERFORMANCE_PROFILE = None
+
+AUTO_HEADROOM = 0.25  # Défaut: 0.25 | Marge sur le budget de frame (0.25 = coût ≤ 75% du budget)
+DRIFT_SECONDS = 3.0   # Défaut: 3.0 | Dépassement soutenu avant de descendre de profil
+# Frame de sonde du mode auto (à côté du serveur) : une main visible, sinon la sonde ne mesure
+# que la détection de paume. Touche 'p' de calibration.py | absente = frame caméra au démarrage
+PROBE_IMAGE = "probe_hand.jpg"
+
+# Du plus qualitatif au plus léger
+PROFILES = {
+    # Qualité (haute précision, PC puissant)
+    "qualite":     {"FPS_LIMIT": 60, "PREVIEW_EVERY": 2, "PREVIEW_W": 480, "PREVIEW_H": 270,
+                    "PREVIEW_JPEG_QUALITY": 80, "MODEL_COMPLEXITY": 1,
+                    "DETECTION_CONFIDENCE": 0.7, "TRACKING_CONFIDENCE": 0.7},
+    # Standard (valeurs par défaut du serveur)
+    "standard":    {"FPS_LIMIT": 30, "PREVIEW_EVERY": 4, "PREVIEW_W": 320, "PREVIEW_H": 180,
+                    "PREVIEW_JPEG_QUALITY": 65, "MODEL_COMPLEXITY": 1,
+                    "DETECTION_CONFIDENCE": 0.6, "TRACKING_CONFIDENCE": 0.6},
+    # Performance (faible latence, PC lent)
+    "performance": {"FPS_LIMIT": 20, "PREVIEW_EVERY": 6, "PREVIEW_W": 240, "PREVIEW_H": 135,
+                    "PREVIEW_JPEG_QUALITY": 50, "MODEL_COMPLEXITY": 0,
+                    "DETECTION_CONFIDENCE": 0.6, "TRACKING_CONFIDENCE": 0.6},
+}
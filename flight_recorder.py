@@ -0,0 +1,232 @@
+# FLIGHT RECORDER — télémétrie par frame sur disque pour les déploiements longue durée
+# Fichier circulaire de taille fixe, préalloué et mappé en mémoire : chaque frame du
+# serveur écrit un enregistrement binaire (quelques µs), les plus anciens sont écrasés.
+#
+#   python flight_recorder.py flight_recorder.bin stats --last 600
+#   python flight_recorder.py flight_recorder.bin stalls --threshold 100
+#   python flight_recorder.py flight_recorder.bin dump --since "2025-11-12 14:00" --until "2025-11-12 14:05" --csv
+import argparse
+import os
+import sys
+from datetime import datetime
+
+import numpy as np
+
+MAGIC = b"HOLOFR01"
+VERSION = 1
+HEADER_SIZE = 64
+
+HEADER_DTYPE = np.dtype([
+    ("magic", "S8"),
+    ("version", "<u4"),
+    ("capacity", "<u4"),
+    ("record_size", "<u4"),
+    ("count", "<u8"),       # nombre total d'enregistrements écrits (l'index circulaire = count % capacity)
+])
+
+RECORD_DTYPE = np.dtype([
+    ("t", "<f8"),           # time.time() en fin de frame
+    ("frame", "<u4"),
+    ("read_ms", "<f4"),     # cap.read()
+    ("infer_ms", "<f4"),    # flip + conversion + MediaPipe
+    ("gesture_ms", "<f4"),  # GestureState.update
+    ("preview_ms", "<f4"),  # resize + JPEG
+    ("send_ms", "<f4"),     # JSON + diffusion WebSocket
+    ("total_ms", "<f4"),
+    ("rot_dx", "<f4"),
+    ("rot_dy", "<f4"),
+    ("zoom_delta", "<f4"),
+    ("explode", "<f4"),
+    ("n_hands", "u1"),
+    ("freeze", "u1"),
+    ("sent", "u1"),         # 1 si un payload a été diffusé sur cette frame
+    ("send_errors", "u1"),  # clients en échec lors de la diffusion
+    ("n_clients", "<u2"),
+])
+
+STAGES = ["read_ms", "infer_ms", "gesture_ms", "preview_ms", "send_ms", "total_ms"]
+
+
+def _allocate(fh, size, chunk=1 << 20):
+    """Préallocation réelle des blocs disque (pas de fichier creux) : un disque plein échoue
+    ici, à la création, et non plus tard en SIGBUS lors d'une écriture dans le mapping"""
+    if hasattr(os, "posix_fallocate"):
+        os.posix_fallocate(fh.fileno(), 0, size)
+        return
+    zeros = bytes(chunk)
+    for offset in range(0, size, chunk):
+        fh.write(zeros[:min(chunk, size - offset)])
+    fh.flush()
+    os.fsync(fh.fileno())
+
+
+class FlightRecorder:
+    """Écrit la télémétrie par frame dans un fichier circulaire mappé en mémoire"""
+
+    def __init__(self, path, capacity):
+        size = HEADER_SIZE + capacity * RECORD_DTYPE.itemsize
+        if not self._compatible(path, capacity):
+            if os.path.exists(path):
+                # Format ou capacité différents : l'ancienne télémétrie est conservée à côté
+                os.replace(path, path + ".bak")
+                print(f"⚠️  {path} incompatible (format ou FLIGHT_RECORDER_FRAMES), sauvegardé en {path}.bak")
+            with open(path, "wb") as fh:
+                _allocate(fh, size)
+            header = np.memmap(path, dtype=HEADER_DTYPE, mode="r+", shape=(1,))
+            header[0] = (MAGIC, VERSION, capacity, RECORD_DTYPE.itemsize, 0)
+            header.flush()
+            del header
+        self.capacity = capacity
+        self.header = np.memmap(path, dtype=HEADER_DTYPE, mode="r+", shape=(1,))
+        self.records = np.memmap(path, dtype=RECORD_DTYPE, mode="r+", offset=HEADER_SIZE, shape=(capacity,))
+        self.count = int(self.header["count"][0])
+
+    @staticmethod
+    def _compatible(path, capacity):
+        """Réutilise un fichier existant s'il a le même format (la session reprend à la suite)"""
+        if not os.path.exists(path) or os.path.getsize(path) < HEADER_SIZE:
+            return False
+        header = read_header(path)
+        return (header["magic"] == MAGIC and header["version"] == VERSION
+                and header["capacity"] == capacity and header["record_size"] == RECORD_DTYPE.itemsize
+                and os.path.getsize(path) == HEADER_SIZE + capacity * RECORD_DTYPE.itemsize)
+
+    def record(self, *values):
+        """Ajoute un enregistrement (valeurs dans l'ordre de RECORD_DTYPE)"""
+        self.records[self.count % self.capacity] = values
+        self.count += 1
+        self.header["count"] = self.count
+
+    def close(self):
+        self.records.flush()
+        self.header.flush()
+
+
+# ============================================
+# 📖 LECTURE
+# ============================================
+
+def read_header(path):
+    header = np.fromfile(path, dtype=HEADER_DTYPE, count=1)[0]
+    return {name: header[name] for name in HEADER_DTYPE.names}
+
+def read_records(path):
+    """Tous les enregistrements présents, du plus ancien au plus récent"""
+    header = read_header(path)
+    if header["magic"] != MAGIC:
+        raise ValueError(f"{path}: pas un fichier flight recorder")
+    capacity, count = int(header["capacity"]), int(header["count"])
+    if os.path.getsize(path) < HEADER_SIZE + capacity * RECORD_DTYPE.itemsize:
+        raise ValueError(f"{path}: fichier tronqué (capacité {capacity} frames annoncée par l'en-tête)")
+    records = np.memmap(path, dtype=RECORD_DTYPE, mode="r", offset=HEADER_SIZE, shape=(capacity,))
+    if count <= capacity:
+        return np.array(records[:count])
+    start = count % capacity
+    return np.concatenate([records[start:], records[:start]])
+
+def select_window(records, last=None, since=None, until=None):
+    if last is not None and len(records):
+        records = records[records["t"] >= records["t"][-1] - last]
+    if since is not None:
+        records = records[records["t"] >= since.timestamp()]
+    if until is not None:
+        records = records[records["t"] <= until.timestamp()]
+    return records
+
+def percentiles(records):
+    """p50/p90/p99/max (ms) par étape"""
+    return {stage: np.percentile(records[stage], [50, 90, 99, 100]) for stage in STAGES}
+
+def find_stalls(records, threshold_ms):
+    """Frames dont le traitement ou l'écart avec la précédente dépasse threshold_ms : (index, durée ms, cause)"""
+    stalls = []
+    gaps = np.diff(records["t"]) * 1000.0
+    for i in np.flatnonzero(gaps > threshold_ms) + 1:
+        stalls.append((i, float(gaps[i - 1]), "écart"))
+    for i in np.flatnonzero(records["total_ms"] > threshold_ms):
+        stage = max(STAGES[:-1], key=lambda s: records[s][i])
+        stalls.append((i, float(records["total_ms"][i]), stage))
+    return sorted(stalls)
+
+# ============================================
+# 🖥️ CLI
+# ============================================
+
+def _fmt_time(t):
+    return datetime.fromtimestamp(t).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+
+def cmd_dump(records, args):
+    cols = list(RECORD_DTYPE.names)
+    if args.csv:
+        print(",".join(cols))
+        for r in records:
+            print(",".join(str(r[c]) for c in cols))
+        return
+    for r in records:
+        print(f"{_fmt_time(r['t'])} #{r['frame']:<7} total={r['total_ms']:6.1f}ms "
+              f"(read={r['read_ms']:.1f} infer={r['infer_ms']:.1f} geste={r['gesture_ms']:.2f} "
+              f"preview={r['preview_ms']:.1f} envoi={r['send_ms']:.1f}) mains={r['n_hands']} "
+              f"clients={r['n_clients']} envoyé={r['sent']} erreurs={r['send_errors']} "
+              f"rot=({r['rot_dx']:+.4f},{r['rot_dy']:+.4f}) zoom={r['zoom_delta']:+.4f} "
+              f"explode={r['explode']:.2f} freeze={r['freeze']}")
+
+def cmd_stats(records, args):
+    duration = records["t"][-1] - records["t"][0]
+    print(f"📊 {len(records)} frames du {_fmt_time(records['t'][0])} au {_fmt_time(records['t'][-1])}")
+    if duration > 0:
+        print(f"  FPS moyen      : {(len(records) - 1) / duration:.1f}")
+    print(f"  Mains (moy.)   : {records['n_hands'].mean():.2f} | frames avec main: {(records['n_hands'] > 0).mean():.0%}")
+    print(f"  Clients (max)  : {records['n_clients'].max()} | envois: {int(records['sent'].sum())}"
+          f" | erreurs d'envoi: {int(records['send_errors'].sum())}")
+    print(f"\n  {'Étape':<12}{'p50':>9}{'p90':>9}{'p99':>9}{'max':>9}  (ms)")
+    for stage, (p50, p90, p99, pmax) in percentiles(records).items():
+        print(f"  {stage[:-3]:<12}{p50:>9.2f}{p90:>9.2f}{p99:>9.2f}{pmax:>9.2f}")
+
+def cmd_stalls(records, args):
+    stalls = find_stalls(records, args.threshold)
+    print(f"🐢 {len(stalls)} stall(s) > {args.threshold:.0f} ms sur {len(records)} frames")
+    for i, ms, cause in stalls:
+        r = records[i]
+        print(f"  {_fmt_time(r['t'])} #{r['frame']:<7} {ms:8.1f} ms  ({cause}) mains={r['n_hands']} clients={r['n_clients']}")
+
+def _parse_time(value):
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        # Heure seule (HH:MM[:SS]) : aujourd'hui
+        t = datetime.strptime(value, "%H:%M:%S" if value.count(":") == 2 else "%H:%M").time()
+        return datetime.combine(datetime.now().date(), t)
+
+def main():
+    ap = argparse.ArgumentParser(description="Lecture du flight recorder du serveur de gestes")
+    ap.add_argument("path", help="Fichier flight recorder (FLIGHT_RECORDER_PATH)")
+    sub = ap.add_subparsers(dest="command", required=True)
+    for name, help_text in [("dump", "Affiche les frames d'une fenêtre de temps"),
+                            ("stats", "Percentiles de latence par étape"),
+                            ("stalls", "Frames lentes et trous dans la timeline")]:
+        p = sub.add_parser(name, help=help_text)
+        p.add_argument("--last", type=float, help="Dernières N secondes")
+        p.add_argument("--since", type=_parse_time, help="Début (ISO ou HH:MM[:SS])")
+        p.add_argument("--until", type=_parse_time, help="Fin (ISO ou HH:MM[:SS])")
+        if name == "dump":
+            p.add_argument("--csv", action="store_true", help="Sortie CSV")
+        if name == "stalls":
+            p.add_argument("--threshold", type=float, default=100.0, help="Seuil en ms (défaut: 100)")
+    args = ap.parse_args()
+
+    if not os.path.exists(args.path):
+        ap.error(f"{args.path}: fichier introuvable")
+    if os.path.getsize(args.path) < HEADER_SIZE:
+        ap.error(f"{args.path}: fichier tronqué (< {HEADER_SIZE} octets), pas un fichier flight recorder")
+    try:
+        records = read_records(args.path)
+    except (ValueError, OSError) as e:
+        ap.error(str(e))
+    records = select_window(records, args.last, args.since, args.until)
+    if not len(records):
+        print("Aucune frame dans la fenêtre demandée")
+        sys.exit(1)
+    {"dump": cmd_dump, "stats": cmd_stats, "stalls": cmd_stalls}[args.command](records, args)
+
+if __name__ == "__main__":
+    main()
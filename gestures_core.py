@@ -0,0 +1,139 @@
+# gestures_core.py — logique des gestes (numpy pur, sans caméra ni mediapipe)
+# Partagée par gestures_server.py (temps réel) et autotune.py (rejeu hors-ligne)
+from dataclasses import dataclass, field
+import numpy as np
+
+# Indices des landmarks MediaPipe Hands
+WRIST, THUMB_TIP, INDEX_PIP, INDEX_TIP = 0, 4, 6, 8
+FINGER_PAIRS = [(8,6), (12,10), (16,14), (20,18)]  # (tip, pip) index → auriculaire
+
+PINCH_THRESHOLD = 0.08
+FREEZE_DURATION = 0.3     # secondes de freeze après un poing
+
+def landmarks_to_array(landmarks):
+    """Convertit une liste de landmarks MediaPipe en tableau (21, 3) float32"""
+    return np.array([(p.x, p.y, p.z) for p in landmarks], dtype=np.float32)
+
+def finger_extended(lm, tip, pip):
+    return lm[tip, 1] < lm[pip, 1]
+
+def fist_closed(lm):
+    ext = sum(lm[tip, 1] < lm[pip, 1] for tip, pip in FINGER_PAIRS)
+    return ext <= 1
+
+def is_pinching(lm, thumb_tip=THUMB_TIP, index_tip=INDEX_TIP, threshold=PINCH_THRESHOLD):
+    """Détecte si le pouce et l'index sont en pincement"""
+    distance = np.linalg.norm(lm[thumb_tip, :2] - lm[index_tip, :2])
+    return distance < threshold
+
+def is_hand_open(lm):
+    """Détecte si la main est ouverte (tous les doigts étendus)"""
+    extended = sum(lm[tip, 1] < lm[pip, 1] for tip, pip in FINGER_PAIRS)
+    return extended >= 3  # Au moins 3 doigts levés = main ouverte
+
+@dataclass
+class GestureParams:
+    rot_gain: float = 2.0
+    zoom_gain: float = 0.5
+    exp_gain: float = 0.02
+    smooth: float = 0.3
+    rot_deadzone: float = 0.00005
+    zoom_deadzone: float = 0.002
+    vel_decay: float = 0.85
+
+@dataclass
+class GestureState:
+    """État des gestes d'une frame à l'autre (rotation, zoom, explosion, freeze)"""
+    params: GestureParams = field(default_factory=GestureParams)
+    prev_wrist: np.ndarray = None
+    rot_vel: np.ndarray = field(default_factory=lambda: np.zeros(2, dtype=np.float32))
+    explode_factor: float = 0.0
+    freeze_until: float = 0.0
+    moving_avg_dist: float = None
+
+    def update(self, hands_lm, now):
+        """Avance d'une frame. hands_lm : liste de tableaux (21, 3). Retourne le payload gestes."""
+        p = self.params
+        rot_dx = rot_dy = 0.0
+        zoom_delta = 0.0
+        frozen = now < self.freeze_until
+
+        # ROTATION : Une seule main, mouvement du poignet
+        if len(hands_lm) == 1 and not frozen:
+            wrist = hands_lm[0][WRIST, :2].astype(np.float32)
+            if self.prev_wrist is not None:
+                delta = wrist - self.prev_wrist
+                # Deadzone : ignore micro-mouvements
+                if abs(delta[0]) < p.rot_deadzone: delta[0] = 0.0
+                if abs(delta[1]) < p.rot_deadzone: delta[1] = 0.0
+                # Lissage vélocité
+                self.rot_vel = p.smooth * self.rot_vel + (1.0 - p.smooth) * delta
+                # Application : horizontal pour Y, vertical pour X
+                rot_dx = float(-self.rot_vel[0] * p.rot_gain)
+                rot_dy = float(self.rot_vel[1] * p.rot_gain)
+            self.prev_wrist = wrist
+        else:
+            self.prev_wrist = None
+            self.rot_vel *= p.vel_decay
+
+        # ZOOM : Deux mains en pincement, distance entre les pincements
+        if len(hands_lm) >= 2 and not frozen and is_pinching(hands_lm[0]) and is_pinching(hands_lm[1]):
+            dist = float(np.linalg.norm(hands_lm[1][THUMB_TIP, :2] - hands_lm[0][THUMB_TIP, :2]))
+            if self.moving_avg_dist is None:
+                self.moving_avg_dist = dist
+            diff = dist - self.moving_avg_dist
+            # Deadzone zoom : ignore petites variations
+            if abs(diff) > p.zoom_deadzone:
+                self.moving_avg_dist = 0.9 * self.moving_avg_dist + 0.1 * dist
+                # NORMAL : écarter = zoom+, rapprocher = zoom-
+                zoom_delta = diff * p.zoom_gain
+        else:
+            self.moving_avg_dist = None
+
+        # Explosé : index levé de la main 1
+        if hands_lm and not frozen:
+            idx_up = finger_extended(hands_lm[0], INDEX_TIP, INDEX_PIP)
+            self.explode_factor = float(
+                np.clip(self.explode_factor + (p.exp_gain if idx_up else -p.exp_gain), 0.0, 1.0)
+            )
+
+        # Freeze : poing
+        if hands_lm and fist_closed(hands_lm[0]):
+            self.freeze_until = now + FREEZE_DURATION
+
+        return {
+            "rot_dx": rot_dx,
+            "rot_dy": rot_dy,
+            "zoom_delta": zoom_delta,
+            "explode": self.explode_factor,
+            "freeze": frozen
+        }
+
+# ============================================
+# 🎬 SESSIONS ENREGISTRÉES (rejeu hors-ligne)
+# ============================================
+MAX_HANDS = 2
+
+def save_session(path, timestamps, frames):
+    """Sauvegarde une session : timestamps (T,) et frames = liste de listes de tableaux (21, 3)"""
+    n = len(frames)
+    landmarks = np.full((n, MAX_HANDS, 21, 3), np.nan, dtype=np.float32)
+    n_hands = np.zeros(n, dtype=np.int8)
+    for i, hands_lm in enumerate(frames):
+        hands_lm = hands_lm[:MAX_HANDS]
+        n_hands[i] = len(hands_lm)
+        for h, lm in enumerate(hands_lm):
+            landmarks[i, h] = lm
+    np.savez_compressed(path, t=np.asarray(timestamps, dtype=np.float64),
+                        n_hands=n_hands, landmarks=landmarks)
+
+def load_session(path):
+    """Charge une session : retourne (t, n_hands, landmarks (T, 2, 21, 3))"""
+    with np.load(path) as data:
+        return data["t"], data["n_hands"], data["landmarks"]
+
+def iter_session(path):
+    """Rejoue une session frame par frame : (timestamp, hands_lm)"""
+    t, n_hands, landmarks = load_session(path)
+    for i in range(len(t)):
+        yield float(t[i]), [landmarks[i, h] for h in range(n_hands[i])]
@@ -1,9 +1,15 @@
 # gestures_server.py — WS serveur + preview base64
-import asyncio, json, time, base64
-import numpy as np
-import cv2
-import mediapipe as mp
+# cv2 / mediapipe sont importés à la demande : le serveur WebSocket écoute tout de
+# suite, pendant que la caméra s'ouvre et que le modèle chauffe en parallèle.
+import time
+# Origine des métriques de démarrage : avant tous les autres imports (seul le lancement
+# de l'interpréteur lui-même n'est pas compté)
+START = time.perf_counter()
+
+import argparse, asyncio, json, os, runpy, base64
 import websockets
+from gestures_core import GestureParams, GestureState, landmarks_to_array
+from flight_recorder import FlightRecorder
 
 WS_HOST = "127.0.0.1"
 WS_PORT = 8765
@@ -30,143 +36,277 @@ PREVIEW_EVERY  = 4         # envoie 1 frame / 4
 PREVIEW_W, PREVIEW_H = 320, 180
 PREVIEW_JPEG_QUALITY = 65  # 50-80 recommandé
 
-mp_hands = mp.solutions.hands
-clients = set()
+# Caméra / MediaPipe
+CAMERA_INDEX = 0
+CAMERA_WIDTH, CAMERA_HEIGHT = 1280, 720
+MAX_HANDS = 2
+DETECTION_CONFIDENCE = 0.6
+TRACKING_CONFIDENCE = 0.6
+MODEL_COMPLEXITY = 1
+
+# Profils de performance, du plus qualitatif au plus léger
+PERFORMANCE_PROFILE = None  # None = constantes ci-dessus | nom de profil | "auto" = micro-benchmark au démarrage
+PROFILES = {
+    "qualite":     {"FPS_LIMIT": 60, "PREVIEW_EVERY": 2, "PREVIEW_W": 480, "PREVIEW_H": 270,
+                    "PREVIEW_JPEG_QUALITY": 80, "MODEL_COMPLEXITY": 1,
+                    "DETECTION_CONFIDENCE": 0.7, "TRACKING_CONFIDENCE": 0.7},
+    "standard":    {"FPS_LIMIT": 30, "PREVIEW_EVERY": 4, "PREVIEW_W": 320, "PREVIEW_H": 180,
+                    "PREVIEW_JPEG_QUALITY": 65, "MODEL_COMPLEXITY": 1,
+                    "DETECTION_CONFIDENCE": 0.6, "TRACKING_CONFIDENCE": 0.6},
+    "performance": {"FPS_LIMIT": 20, "PREVIEW_EVERY": 6, "PREVIEW_W": 240, "PREVIEW_H": 135,
+                    "PREVIEW_JPEG_QUALITY": 50, "MODEL_COMPLEXITY": 0,
+                    "DETECTION_CONFIDENCE": 0.6, "TRACKING_CONFIDENCE": 0.6},
+}
+AUTO_HEADROOM = 0.25        # mode auto : coût estimé ≤ 75% du budget de frame
+DRIFT_SECONDS = 3.0         # mode auto : dépassement soutenu du budget avant de descendre de profil
+PROBE_IMAGE = "probe_hand.jpg"  # mode auto : frame avec une main (touche 'p' de calibration.py), sinon caméra
 
-def finger_extended(landmarks, tip, pip):
-    return landmarks[tip].y < landmarks[pip].y
+# Flight recorder : télémétrie par frame dans un fichier circulaire (python flight_recorder.py FICHIER stats)
+FLIGHT_RECORDER = True
+FLIGHT_RECORDER_PATH = "flight_recorder.bin"  # relatif = à côté du serveur, comme config.py
+FLIGHT_RECORDER_FRAMES = 30 * 60 * 60 * 24  # 24 h à 30 FPS (~150 Mo)
 
-def fist_closed(landmarks):
-    pairs = [(8,6),(12,10),(16,14),(20,18)]
-    ext = sum(landmarks[tip].y < landmarks[pip].y for tip, pip in pairs)
-    return ext <= 1
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CONFIG_PATH = os.path.join(BASE_DIR, "config.py")
+
+clients = set()
+current_profile = None
 
-def is_pinching(landmarks, thumb_tip=4, index_tip=8, threshold=0.08):
-    """Détecte si le pouce et l'index sont en pincement"""
-    thumb = np.array([landmarks[thumb_tip].x, landmarks[thumb_tip].y])
-    index = np.array([landmarks[index_tip].x, landmarks[index_tip].y])
-    distance = np.linalg.norm(thumb - index)
-    return distance < threshold
+# État du pipeline annoncé aux clients : "warming" tant que caméra + modèle ne sont pas prêts
+pipeline_status = "warming"
+startup_metrics = {}  # ms depuis START (imports compris) : server_bind, camera, model, ready, first_frame, first_gesture
 
-def is_hand_open(landmarks):
-    """Détecte si la main est ouverte (tous les doigts étendus)"""
-    # Index, majeur, annulaire, auriculaire
-    fingers = [(8,6), (12,10), (16,14), (20,18)]
-    extended = sum(landmarks[tip].y < landmarks[pip].y for tip, pip in fingers)
-    return extended >= 3  # Au moins 3 doigts levés = main ouverte
+def since_start_ms():
+    return round((time.perf_counter() - START) * 1000.0, 1)
+
+def status_message():
+    return json.dumps({"status": pipeline_status, "startup": startup_metrics})
 
 async def ws_handler(websocket):
     clients.add(websocket)
     try:
+        await websocket.send(status_message())
         await websocket.wait_closed()
     finally:
         clients.discard(websocket)
 
-async def broadcast_loop():
-    cap = cv2.VideoCapture(0, cv2.CAP_DSHOW)
-    cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
-    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
-
-    with mp_hands.Hands(
-        max_num_hands=2,
-        min_detection_confidence=0.6,
-        min_tracking_confidence=0.6,
-        model_complexity=1
-    ) as hands:
-
-        prev_wrist = None
-        rot_vel = np.array([0.0, 0.0], dtype=np.float32)
-        explode_factor = 0.0
-        freeze_until = 0.0
+def load_config(path):
+    """Applique les constantes MAJUSCULES d'un fichier de config (cf. config.example.py).
+    Retourne (clés appliquées, clés MAJUSCULES inconnues du serveur)."""
+    if not os.path.exists(path):
+        return [], []
+    values = runpy.run_path(path)
+    keys = [k for k in values if k.isupper()]
+    applied = [k for k in keys if k in globals()]
+    for k in applied:
+        globals()[k] = values[k]
+    return applied, [k for k in keys if k not in globals()]
+
+def apply_profile(name):
+    global current_profile
+    globals().update(PROFILES[name])
+    current_profile = name
+
+def encode_preview(frame, size=None, quality=None):
+    """Miniature JPEG base64 de la frame (None si l'encodage échoue)"""
+    import cv2
+    size = size or (PREVIEW_W, PREVIEW_H)
+    quality = quality or PREVIEW_JPEG_QUALITY
+    thumb = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+    ok_jpg, jpg = cv2.imencode(".jpg", thumb, [int(cv2.IMWRITE_JPEG_QUALITY), quality])
+    if not ok_jpg:
+        return None
+    return base64.b64encode(jpg.tobytes()).decode("ascii")
+
+async def broadcast(msg):
+    """Envoie msg à tous les clients connectés ; retourne le nombre d'envois en échec"""
+    if not clients:
+        return 0
+    results = await asyncio.gather(*(c.send(msg) for c in list(clients)), return_exceptions=True)
+    return sum(isinstance(r, Exception) for r in results)
+
+def open_camera():
+    """Ouvre la webcam (thread de démarrage)"""
+    import cv2
+    cap = cv2.VideoCapture(CAMERA_INDEX, cv2.CAP_DSHOW)
+    cap.set(cv2.CAP_PROP_FRAME_WIDTH, CAMERA_WIDTH)
+    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, CAMERA_HEIGHT)
+    startup_metrics["camera"] = since_start_ms()
+    return cap
+
+def create_hands(complexity=None):
+    import mediapipe as mp
+    return mp.solutions.hands.Hands(
+        max_num_hands=MAX_HANDS,
+        min_detection_confidence=DETECTION_CONFIDENCE,
+        min_tracking_confidence=TRACKING_CONFIDENCE,
+        model_complexity=MODEL_COMPLEXITY if complexity is None else complexity
+    )
+
+def warm_hands():
+    """MediaPipe Hands avec son graphe déjà initialisé sur une frame factice"""
+    import numpy as np
+    hands = create_hands()
+    hands.process(np.zeros((CAMERA_HEIGHT, CAMERA_WIDTH, 3), dtype=np.uint8))
+    return hands
+
+def _median_ms(fn, samples):
+    times = []
+    for _ in range(samples):
+        t0 = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - t0) * 1000.0)
+    return sorted(times)[len(times) // 2]
+
+def probe_frame(cap):
+    """Frame BGR de la sonde : PROBE_IMAGE si présente, sinon la caméra"""
+    import cv2
+    path = os.path.join(BASE_DIR, PROBE_IMAGE)
+    frame = cv2.imread(path) if os.path.exists(path) else None
+    if frame is not None:
+        return cv2.resize(frame, (CAMERA_WIDTH, CAMERA_HEIGHT)), PROBE_IMAGE
+    for _ in range(10):  # laisse l'exposition de la caméra se stabiliser
+        ok, live = cap.read()
+        frame = live if ok else frame
+    if frame is None:
+        raise RuntimeError("sonde : aucune frame caméra")
+    return frame, "caméra"
+
+def probe_hardware(cap, samples=5):
+    """Micro-benchmark (ms) sur une frame réelle : flip + conversion, inférence par complexité
+    de modèle (détection + landmarks si une main est visible), encodage preview par profil"""
+    import cv2
+    frame, source = probe_frame(cap)
+    def convert():
+        return cv2.cvtColor(cv2.flip(frame, 1), cv2.COLOR_BGR2RGB)
+    rgb = convert()
+    prep = _median_ms(convert, samples)
+    infer, found = {}, True
+    for c in sorted({p["MODEL_COMPLEXITY"] for p in PROFILES.values()}):
+        with create_hands(c) as hands:
+            found = bool(hands.process(rgb).multi_hand_landmarks) and found  # initialisation du graphe, hors mesure
+            infer[c] = _median_ms(lambda: hands.process(rgb), samples)
+    if not found:
+        print(f"⚠️  Sonde ({source}) : aucune main détectée, l'inférence mesurée est un minorant "
+              f"(enregistrez {PROBE_IMAGE} avec la touche 'p' de calibration.py)")
+    encode = {
+        name: _median_ms(lambda: encode_preview(frame, (p["PREVIEW_W"], p["PREVIEW_H"]), p["PREVIEW_JPEG_QUALITY"]), samples)
+        for name, p in PROFILES.items()
+    }
+    return prep, infer, encode
+
+def pick_profile(prep, infer, encode):
+    """Profil le plus qualitatif dont le coût estimé tient dans son budget avec la marge AUTO_HEADROOM"""
+    names = list(PROFILES)
+    for name in names:
+        p = PROFILES[name]
+        cost = prep + infer[p["MODEL_COMPLEXITY"]] + encode[name] / p["PREVIEW_EVERY"]
+        if cost <= (1000.0 / p["FPS_LIMIT"]) * (1.0 - AUTO_HEADROOM):
+            return name, cost
+    return names[-1], cost
+
+def load_hands(cap=None):
+    """Choisit le profil (mode auto, sur une frame de cap) puis construit le modèle (thread de démarrage)"""
+    if PERFORMANCE_PROFILE == "auto":
+        prep, infer, encode = probe_hardware(cap)
+        name, cost = pick_profile(prep, infer, encode)
+        apply_profile(name)
+        startup_metrics["probe"] = since_start_ms()
+        print(f"🔧 Profil auto: {name} (coût estimé {cost:.1f} ms / budget {1000.0 / FPS_LIMIT:.1f} ms | "
+              f"conversion {prep:.1f} ms, inférence {', '.join(f'c{c}={ms:.1f}' for c, ms in infer.items())} ms)")
+    hands = warm_hands()
+    startup_metrics["model"] = since_start_ms()
+    return hands
+
+async def step_down(hands, frame_ms):
+    """Passe au profil suivant (plus léger) ; recharge le modèle si sa complexité ou ses seuils changent"""
+    names = list(PROFILES)
+    i = names.index(current_profile)
+    if i + 1 >= len(names):
+        return hands
+    old, budget = current_profile, 1000.0 / FPS_LIMIT
+    old_model = (MODEL_COMPLEXITY, DETECTION_CONFIDENCE, TRACKING_CONFIDENCE)
+    apply_profile(names[i + 1])
+    print(f"🔻 [{time.strftime('%H:%M:%S')}] Profil {old} → {current_profile} "
+          f"(frame {frame_ms:.1f} ms > budget {budget:.1f} ms)")
+    if (MODEL_COMPLEXITY, DETECTION_CONFIDENCE, TRACKING_CONFIDENCE) != old_model:
+        hands.close()
+        hands = await asyncio.to_thread(warm_hands)
+    return hands
+
+def open_recorder():
+    """Flight recorder, ou None s'il est désactivé ou si son fichier ne peut pas être créé"""
+    if not FLIGHT_RECORDER:
+        return None
+    try:
+        return FlightRecorder(os.path.join(BASE_DIR, FLIGHT_RECORDER_PATH), FLIGHT_RECORDER_FRAMES)
+    except OSError as e:
+        print(f"⚠️  Flight recorder désactivé : {e}")
+        return None
+
+async def warm_up():
+    """Caméra, modèle et flight recorder en parallèle, puis annonce "ready" aux clients.
+    Mode auto : la sonde a besoin de la caméra et ne doit pas partager le CPU avec son ouverture,
+    le modèle passe donc après la caméra."""
+    global pipeline_status
+    if PERFORMANCE_PROFILE == "auto":
+        cap, recorder = await asyncio.gather(asyncio.to_thread(open_camera), asyncio.to_thread(open_recorder))
+        hands = await asyncio.to_thread(load_hands, cap)
+    else:
+        cap, hands, recorder = await asyncio.gather(
+            asyncio.to_thread(open_camera), asyncio.to_thread(load_hands), asyncio.to_thread(open_recorder))
+    pipeline_status = "ready"
+    startup_metrics["ready"] = since_start_ms()
+    print(f"🚀 Pipeline prêt en {startup_metrics['ready']:.0f} ms "
+          f"(caméra {startup_metrics['camera']:.0f} ms, modèle {startup_metrics['model']:.0f} ms)")
+    await broadcast(status_message())
+    return cap, hands, recorder
+
+async def broadcast_loop(cap, hands, recorder):
+    import cv2
+    try:
+        state = GestureState(GestureParams(
+            rot_gain=ROT_GAIN, zoom_gain=ZOOM_GAIN, exp_gain=EXP_GAIN, smooth=SMOOTH,
+            rot_deadzone=ROT_DEADZONE, zoom_deadzone=ZOOM_DEADZONE, vel_decay=VEL_DECAY,
+        ))
         last_send = 0.0
         frame_interval = 1.0 / FPS_LIMIT
-        moving_avg_dist = None
         frame_idx = 0
+        frame_ms_avg = 0.0
+        over_budget_since = None
 
         while True:
+            t_read = time.perf_counter()
             ok, frame = cap.read()
             if not ok:
                 await asyncio.sleep(0.01)
                 continue
+            t_work = time.perf_counter()
 
             frame = cv2.flip(frame, 1)
             rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
             res = hands.process(rgb)
-
-            rot_dx = rot_dy = 0.0
-            zoom_delta = 0.0
-            frozen = time.time() < freeze_until
+            if "first_frame" not in startup_metrics:
+                startup_metrics["first_frame"] = since_start_ms()
 
             hands_lm = []
             if res.multi_hand_landmarks:
                 for hlm in res.multi_hand_landmarks:
-                    hands_lm.append(hlm.landmark)
-
-            # ROTATION : Une seule main, mouvement du poignet
-            if len(hands_lm) == 1 and not frozen:
-                lm = hands_lm[0]
-                wrist = np.array([lm[0].x, lm[0].y], dtype=np.float32)
-                if prev_wrist is not None:
-                    delta = wrist - prev_wrist
-                    # Deadzone : ignore micro-mouvements
-                    if abs(delta[0]) < ROT_DEADZONE: delta[0] = 0.0
-                    if abs(delta[1]) < ROT_DEADZONE: delta[1] = 0.0
-                    # Lissage vélocité
-                    rot_vel = SMOOTH * rot_vel + (1.0 - SMOOTH) * delta
-                    # Application : horizontal pour Y, vertical pour X
-                    rot_dx = float(-rot_vel[0] * ROT_GAIN)
-                    rot_dy = float(rot_vel[1] * ROT_GAIN)
-                prev_wrist = wrist
-            else:
-                prev_wrist = None
-                rot_vel *= VEL_DECAY
-
-            # ZOOM : Deux mains en pincement, distance entre les pincements
-            if len(hands_lm) >= 2 and not frozen:
-                # Vérifier que les deux mains sont en pincement
-                hand1_pinching = is_pinching(hands_lm[0])
-                hand2_pinching = is_pinching(hands_lm[1])
-                
-                if hand1_pinching and hand2_pinching:
-                    # Mesurer distance entre les deux pincements (pouce-index)
-                    pinch1 = np.array([hands_lm[0][4].x, hands_lm[0][4].y], dtype=np.float32)
-                    pinch2 = np.array([hands_lm[1][4].x, hands_lm[1][4].y], dtype=np.float32)
-                    dist = float(np.linalg.norm(pinch2 - pinch1))
-                    
-                    if moving_avg_dist is None:
-                        moving_avg_dist = dist
-                    diff = dist - moving_avg_dist
-                    # Deadzone zoom : ignore petites variations
-                    if abs(diff) > ZOOM_DEADZONE:
-                        moving_avg_dist = 0.9 * moving_avg_dist + 0.1 * dist
-                        # NORMAL : écarter = zoom+, rapprocher = zoom-
-                        zoom_delta = diff * ZOOM_GAIN
-                else:
-                    moving_avg_dist = None
-            else:
-                moving_avg_dist = None
-
-            # Explosé : index levé de la main 1
-            if hands_lm and not frozen:
-                idx_up = finger_extended(hands_lm[0], 8, 6)
-                explode_factor = float(
-                    np.clip(explode_factor + (EXP_GAIN if idx_up else -EXP_GAIN), 0.0, 1.0)
-                )
+                    hands_lm.append(landmarks_to_array(hlm.landmark))
+            t_infer = time.perf_counter()
 
-            # Freeze : poing
-            if hands_lm and fist_closed(hands_lm[0]):
-                freeze_until = time.time() + 0.3
+            gestures = state.update(hands_lm, time.time())
+            t_gesture = time.perf_counter()
+            preview_ms = send_ms = 0.0
+            sent = send_errors = 0
+            rot_dx, rot_dy = gestures["rot_dx"], gestures["rot_dy"]
+            zoom_delta = gestures["zoom_delta"]
+            explode_factor, frozen = gestures["explode"], gestures["freeze"]
 
             # Prépare payload
             now = time.time()
             if now - last_send >= frame_interval:
-                payload = {
-                    "rot_dx": rot_dx,
-                    "rot_dy": rot_dy,
-                    "zoom_delta": zoom_delta,
-                    "explode": explode_factor,
-                    "freeze": frozen
-                }
+                payload = dict(gestures)
 
                 # DEBUG: Logs détaillés
                 if DEBUG_MODE and (frame_idx % LOG_EVERY_N_FRAMES == 0):
@@ -182,26 +322,97 @@ async def broadcast_loop():
 
                 # Optionnel: aperçu webcam
                 if PREVIEW_ENABLE and (frame_idx % PREVIEW_EVERY == 0):
-                    thumb = cv2.resize(frame, (PREVIEW_W, PREVIEW_H), interpolation=cv2.INTER_AREA)
-                    ok_jpg, jpg = cv2.imencode(".jpg", thumb, [int(cv2.IMWRITE_JPEG_QUALITY), PREVIEW_JPEG_QUALITY])
-                    if ok_jpg:
-                        payload["preview"] = base64.b64encode(jpg.tobytes()).decode("ascii")
+                    t_preview = time.perf_counter()
+                    preview = encode_preview(frame)
+                    if preview:
+                        payload["preview"] = preview
+                    preview_ms = (time.perf_counter() - t_preview) * 1000.0
 
                 if clients:
-                    msg = json.dumps(payload)
-                    await asyncio.gather(*(c.send(msg) for c in list(clients)), return_exceptions=True)
+                    t_send = time.perf_counter()
+                    send_errors = await broadcast(json.dumps(payload))
+                    send_ms = (time.perf_counter() - t_send) * 1000.0
+                    sent = 1
                 last_send = now
 
+                # Time-to-first-gesture : premier payload envoyé avec une main détectée
+                if hands_lm and "first_gesture" not in startup_metrics:
+                    startup_metrics["first_gesture"] = since_start_ms()
+                    print(f"⏱️  Premier geste à {startup_metrics['first_gesture']:.0f} ms "
+                          f"(bind {startup_metrics['server_bind']:.0f} ms, prêt {startup_metrics['ready']:.0f} ms, "
+                          f"1re frame {startup_metrics['first_frame']:.0f} ms)")
+
+            if recorder:
+                try:
+                    recorder.record(
+                        time.time(), frame_idx,
+                        (t_work - t_read) * 1000.0, (t_infer - t_work) * 1000.0, (t_gesture - t_infer) * 1000.0,
+                        preview_ms, send_ms, (time.perf_counter() - t_read) * 1000.0,
+                        rot_dx, rot_dy, zoom_delta, explode_factor,
+                        len(hands_lm), frozen, sent, min(send_errors, 255), len(clients),
+                    )
+                except OSError as e:
+                    # La télémétrie ne doit jamais arrêter le serveur
+                    print(f"⚠️  Flight recorder désactivé : {e}")
+                    recorder = None
+
+            # Mode auto : descend de profil si le temps de frame dépasse durablement le budget
+            if PERFORMANCE_PROFILE == "auto":
+                frame_ms_avg = 0.9 * frame_ms_avg + 0.1 * (time.perf_counter() - t_work) * 1000.0
+                if frame_ms_avg > 1000.0 / FPS_LIMIT:
+                    if over_budget_since is None:
+                        over_budget_since = now
+                    elif now - over_budget_since > DRIFT_SECONDS:
+                        hands = await step_down(hands, frame_ms_avg)
+                        frame_interval = 1.0 / FPS_LIMIT
+                        over_budget_since = None
+                else:
+                    over_budget_since = None
+
             frame_idx += 1
             await asyncio.sleep(0.0)
+    finally:
+        cap.release()
+        hands.close()
+        if recorder:
+            recorder.close()
 
 async def main():
+    ap = argparse.ArgumentParser(description="Serveur WebSocket de gestes Holo-Control")
+    ap.add_argument("--config", help="Fichier de config (défaut: config.py à côté du serveur, facultatif)")
+    ap.add_argument("--profile", help="Profil de performance : nom dans PROFILES (config comprise) ou auto")
+    args = ap.parse_args()
+
+    global PERFORMANCE_PROFILE
+    # Seul le config.py par défaut est facultatif : un --config explicite introuvable est une erreur
+    if args.config and not os.path.exists(args.config):
+        ap.error(f"--config {args.config!r} introuvable")
+    args.config = args.config or CONFIG_PATH
+    applied, ignored = load_config(args.config)
+    # Validation après la config : elle peut définir ses propres PROFILES
+    valid = [*PROFILES, "auto"]
+    if args.profile:
+        if args.profile not in valid:
+            ap.error(f"--profile {args.profile!r} inconnu (choix: {', '.join(valid)})")
+        PERFORMANCE_PROFILE = args.profile
+    elif PERFORMANCE_PROFILE is not None and PERFORMANCE_PROFILE not in valid:
+        print(f"⚠️  PERFORMANCE_PROFILE {PERFORMANCE_PROFILE!r} inconnu (choix: {', '.join(valid)}), mode manuel")
+        PERFORMANCE_PROFILE = None
+    if PERFORMANCE_PROFILE in PROFILES:
+        apply_profile(PERFORMANCE_PROFILE)
+    elif PERFORMANCE_PROFILE == "auto":
+        apply_profile(next(iter(PROFILES)))  # remplacé par le micro-benchmark au démarrage
+
     print("\n" + "="*60)
     print("🎮 HOLO-CONTROL SERVEUR DE GESTES")
     print("="*60)
     print(f"\n📡 WebSocket: ws://{WS_HOST}:{WS_PORT}")
     print(f"🎯 FPS Limit: {FPS_LIMIT}")
     print(f"🐛 Debug Mode: {'✅ ACTIF' if DEBUG_MODE else '❌ Désactivé'}")
+    print(f"📄 Config: {args.config if applied else 'défauts du serveur'} ({len(applied)} valeurs)")
+    if ignored:
+        print(f"⚠️  Clés ignorées (inconnues du serveur): {', '.join(ignored)}")
+    print(f"⚡ Profil: {PERFORMANCE_PROFILE or 'manuel'}")
     print(f"\n⚙️  Configuration:")
     print(f"  ROT_GAIN      = {ROT_GAIN}")
     print(f"  ZOOM_GAIN     = {ZOOM_GAIN}")
@@ -214,11 +425,13 @@ async def main():
     print(f"  - Index levé: Explosion")
     print(f"  - Poing fermé: Freeze")
     print("\n" + "="*60)
-    print("✅ Serveur démarré ! En attente de connexions...\n")
-    
+
     server = await websockets.serve(ws_handler, WS_HOST, WS_PORT)
+    startup_metrics["server_bind"] = since_start_ms()
+    print(f"✅ Serveur démarré en {startup_metrics['server_bind']:.0f} ms ! Préchauffage caméra + modèle...\n")
     try:
-        await broadcast_loop()
+        cap, hands, recorder = await warm_up()
+        await broadcast_loop(cap, hands, recorder)
     finally:
         server.close()
         await server.wait_closed()
@@ -117,6 +117,14 @@ export default function App() {
     ws.onmessage = (ev)=>{
       try{
         const msg = JSON.parse(ev.data);
+
+        // État du pipeline serveur ("warming" → "ready")
+        if (msg.status) {
+          console.log(`⏳ [WS] Pipeline: ${msg.status}`, msg.startup);
+          window.dispatchEvent(new CustomEvent("holo:status", { detail: msg }));
+          return;
+        }
+
         const { rot_dx, rot_dy, zoom_delta, explode, preview, freeze } = msg;
         
         // Debug: Log tous les 30 messages
@@ -9,6 +9,7 @@ export default function GesturesHUD() {
     explode: 0,
     freeze: false,
   });
+  const [warming, setWarming] = useState(false);
 
   useEffect(() => {
     const handler = (e) => {
@@ -24,6 +25,12 @@ export default function GesturesHUD() {
     return () => window.removeEventListener("holo:hud", handler);
   }, []);
 
+  useEffect(() => {
+    const handler = (e) => setWarming(e.detail.status === "warming");
+    window.addEventListener("holo:status", handler);
+    return () => window.removeEventListener("holo:status", handler);
+  }, []);
+
   // Normalisation pour affichage (barres -100 à +100)
   const normalizeRot = (val) => Math.max(-100, Math.min(100, val * 2000));
   const normalizeZoom = (val) => Math.max(-100, Math.min(100, val * 50));
@@ -38,6 +45,14 @@ export default function GesturesHUD() {
       <div className="hud-panel">
         <div className="hud-title">GESTES</div>
 
+        {/* Warming indicator (caméra + modèle en cours d'initialisation) */}
+        {warming && (
+          <div className="warming-indicator">
+            <div className="warming-icon">⏳</div>
+            <div className="warming-text">INITIALISATION</div>
+          </div>
+        )}
+
         {/* Freeze indicator */}
         {state.freeze && (
           <div className="freeze-indicator">
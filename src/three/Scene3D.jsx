@@ -122,7 +122,9 @@ export default function Scene3D(){
     ws.onopen = ()=>console.log("[WS] connected");
     ws.onmessage = (ev)=>{
       try{
-        const { rot_dx, rot_dy, zoom_delta, explode } = JSON.parse(ev.data);
+        const msg = JSON.parse(ev.data);
+        if (msg.status) return;
+        const { rot_dx, rot_dy, zoom_delta, explode } = msg;
         const s = stateRef.current;
         s.targetRotY += rot_dx;
         s.targetRotX += rot_dy;